@@ -0,0 +1,676 @@
+#!/usr/bin/env python3
+# debug_production.py - 本番環境デバッグツール
+"""
+市場調査自動化システム 本番環境デバッグツール
+
+Railway上の本番環境に対して疎通確認・調査フロー模擬・依存API確認を行い、
+障害時の一次切り分けに使うスタンドアロンスクリプト。
+
+使い方:
+    python3 debug_production.py
+"""
+
+import argparse
+import asyncio
+import functools
+import io
+import json
+import re
+import socket
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import urlparse
+
+import aiohttp
+
+try:
+    import ahocorasick  # pyahocorasick（任意依存）
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # C実装のJSONライブラリ（任意依存）
+except ImportError:
+    orjson = None
+
+# 本番環境URL（Railway）
+PRODUCTION_URL = 'https://market-research-system-production.up.railway.app'
+
+# 調査フロー模擬実行で送るテストリクエスト（読み取り専用のひな形。
+# 値を差し替えたい場合は dict(_TEST_REQUEST_TEMPLATE, businessName=...) で
+# 浅いコピーを作ること）
+_TEST_REQUEST_TEMPLATE = {
+    'businessName': 'デバッグテスト事業',
+    'serviceHypothesis': {
+        'concept': '本番環境デバッグ用のテストコンセプト',
+        'customerProblem': '本番環境の障害切り分けに時間がかかる',
+        'targetIndustry': 'IT・ソフトウェア',
+        'targetUsers': 'システム運用担当者',
+        'competitors': '手動デバッグ作業',
+    },
+}
+
+# 既知のエラーパターン（パターン名 -> キーワード群）
+_PATTERNS = {
+    'timeout': ['timeout', 'タイムアウト', 'ETIMEDOUT', 'timed out'],
+    'memory': ['out of memory', 'heap', 'ENOMEM', 'memory leak'],
+    'rate_limit': ['rate limit', 'too many requests', '429',
+                   'quota exceeded'],
+    'connection': ['ECONNREFUSED', 'ECONNRESET', 'connection refused',
+                   'socket hang up'],
+    'notion_error': ['notion api', 'unauthorized', 'invalid_request_url',
+                     'object_not_found'],
+    'gemini_error': ['gemini', 'generativelanguage', 'safety',
+                     'blocked', 'RECITATION'],
+}
+
+def _json_loads(data: bytes):
+    """レスポンスボディのJSONをパースする（orjsonがあればそちらを使う）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, pretty: bool = False) -> str:
+    """結果dictをJSON文字列にする（orjsonがあればそちらを使う）
+
+    どちらの実装でも非ASCII文字はエスケープせずそのまま出力する。
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: aiohttpのヘッダーキーはstrのサブクラス
+        # （multidictのistr）で、素のorjsonはTypeErrorにするため必須
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str).decode()
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+    return json.dumps(obj, ensure_ascii=False, default=str,
+                      separators=(',', ':'))
+
+
+def _compile_pattern_groups(keywords):
+    """キーワードを先頭文字ごとにまとめて (プローブ文字, 正規表現) を作る
+
+    全選択肢が同じ文字で始まる正規表現は、正規表現エンジンが
+    先頭1文字のリテラル走査（memchr）で候補位置まで一気に
+    スキップできるため、巨大な1本の選択式より速い。
+
+    さらにグループ共通の先頭文字をプローブとして持たせ、
+    小文字化済みログへの `in` 判定（C実装のmemmem）が外れたら
+    正規表現の実行自体をスキップできるようにする。グループ内の
+    全キーワードが同じ文字で始まるため、この先読みで取り漏らしは
+    発生しない。
+
+    照合対象はUTF-8にエンコードして小文字化したbytes。strより
+    メモリ表現が小さく、キーワード側も小文字bytesで前計算して
+    あるため、IGNORECASEなしの単純照合で済む。
+    """
+    groups = defaultdict(list)
+    for kw in keywords:
+        groups[kw[0].lower()].append(kw)
+    return [
+        (probe.encode('utf-8'),
+         re.compile(b'|'.join(re.escape(k.lower().encode('utf-8'))
+                              for k in kws)),
+         tuple(k.lower().encode('utf-8') for k in kws))
+        for probe, kws in groups.items()
+    ]
+
+
+def _ttl_cache(seconds: int = 30):
+    """プローブ結果をTTL付きでメモ化するデコレーター
+
+    レポート生成直後のメニュー再実行など、短時間に同じプローブを
+    繰り返してもTTL内はネットワークに出ずキャッシュ結果を返す。
+    キャッシュはインスタンス辞書に (取得時刻, 結果) で保持する。
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = (self.base_url, func.__name__)
+            cached = self._probe_cache.get(key)
+            if cached is not None and time.time() - cached[0] < seconds:
+                self._status(f'♻️ キャッシュ結果を使用 ({func.__name__}, TTL {seconds}秒)')
+                return cached[1]
+            result = await func(self, *args, **kwargs)
+            self._probe_cache[key] = (time.time(), result)
+            return result
+        return wrapper
+    return decorator
+
+
+# パターンごとの正規表現群をインポート時に1回だけコンパイルしておく
+# （呼び出しごとの再コンパイルとキーワード単位のlower()コピーを排除）
+_PATTERN_RES = {
+    name: _compile_pattern_groups(kws)
+    for name, kws in _PATTERNS.items()
+}
+
+
+def _build_ac_automaton():
+    """全キーワードを載せたAho-Corasickオートマトンを構築する
+
+    キーワードはすべてリテラルなので、1回の線形走査で全パターン
+    クラスの全キーワード出現を同時に検出できる。pyahocorasickが
+    ない環境ではNoneを返し、正規表現ベースの走査へフォールバック。
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pname, kws in _PATTERNS.items():
+        for kw in kws:
+            automaton.add_word(kw.lower(), (pname, kw.lower()))
+    automaton.make_automaton()
+    return automaton
+
+
+_AC_AUTOMATON = _build_ac_automaton()
+
+
+class ProductionDebugTool:
+    """本番環境の疎通確認・障害切り分けツール
+
+    プローブはすべてaiohttp上の非同期I/Oで実行し、1つの
+    ClientSession（コネクションプール）をインスタンスで使い回す。
+    対話メニューからは同期ラッパー経由で呼び出す。
+    """
+
+    # 基本疎通確認の対象（名前, 相対パス）
+    _ENDPOINTS = (
+        ('health', '/health'),
+        ('api_health', '/api/research/health'),
+        ('prompts', '/api/research/prompts'),
+    )
+
+    # 調査フロー模擬実行の対象（名前, 相対パス）
+    _FLOW_ENDPOINTS = (
+        ('prompts', '/api/research/prompts'),
+        ('validate', '/api/research/validate'),
+        ('info', '/api/research/info'),
+    )
+
+    # 外部API依存の到達性確認対象（名前, 絶対URL）
+    _DEPENDENCIES = (
+        ('notion_api', 'https://api.notion.com/v1/users/me'),
+        ('gemini_api',
+         'https://generativelanguage.googleapis.com/v1beta/models'),
+    )
+
+    # サーキットブレーカー: 同一URLがこの回数連続で接続失敗したら、
+    # 一定時間はネットワークに出ず即座に失敗扱いにする
+    _FAIL_THRESHOLD = 2
+    _FAIL_WINDOW = 60  # 秒
+
+    # 結果に残すレスポンスヘッダー（通常モード）
+    _HEADER_KEYS = ('Content-Type', 'Content-Length', 'Server')
+
+    # 結果に取り込むレスポンスボディの上限（バイト）。エラーページが
+    # 巨大でも結果dictが数MBに膨らまないよう先頭だけ保持する
+    _BODY_LIMIT = 4096
+
+    def __init__(self, base_url: str = PRODUCTION_URL,
+                 verbose: bool = False, status_stream=None):
+        self.base_url = base_url.rstrip('/')
+        self.verbose = verbose
+        # 進行状況の出力先。スクリプトモードではstderrを渡し、
+        # stdoutを結果JSON専用に保つ（パイプ可能にする）
+        self._status_stream = status_stream if status_stream is not None \
+            else sys.stdout
+        # URL連結は呼び出しごとではなくここで1回だけ行う
+        self._urls = {
+            name: f"{self.base_url}{path}"
+            for name, path in self._ENDPOINTS + self._FLOW_ENDPOINTS
+        }
+        # asyncio.run()は呼び出しごとにループを破棄しセッションを
+        # 使い回せないため、インスタンス専用のループを1つ保持する
+        self._loop = asyncio.new_event_loop()
+        self._session = None
+        self._probe_cache = {}
+        self._fail = {}  # url -> (連続失敗回数, 直近失敗時刻)
+
+        # 初回プローブの名前解決分を先払いしておく（結果はOSが
+        # キャッシュし、コネクタのDNSキャッシュも温まった状態で始まる）
+        host = urlparse(self.base_url).hostname
+        if host:
+            try:
+                socket.getaddrinfo(host, 443)
+            except OSError:
+                pass  # 到達不可はプローブ側で検出・報告する
+
+    def _run(self, coro):
+        """同期呼び出し用: インスタンス専用ループでコルーチンを実行"""
+        return self._loop.run_until_complete(coro)
+
+    def _status(self, message: str):
+        """進行状況の1行を出力する（結果データはここを通さない）"""
+        print(message, file=self._status_stream)
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """共有ClientSessionを遅延生成して返す"""
+        if self._session is None or self._session.closed:
+            # keepalive_timeoutを長めに取り、メニュー操作を挟んでも
+            # 確立済みTCP+TLSコネクションを再利用できるようにする
+            connector = aiohttp.TCPConnector(
+                limit=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            # 接続3秒・読み取り10秒を明示し、刺さったエンドポイントが
+            # ツール全体を長時間ブロックしないようにする
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=30, connect=3, sock_read=10),
+                headers={'User-Agent': 'market-research-debug-tool/1.0'},
+            )
+        return self._session
+
+    def _capture_headers(self, headers) -> dict:
+        """結果dictに残すヘッダーを抽出する
+
+        通常モードでは実際に見るキーだけを残し、verboseモードでは
+        全ヘッダーを複製する。キーはmultidictのistr（strサブクラス）
+        なので、JSONシリアライズで型が問題にならないよう素のstrに
+        正規化して返す。
+        """
+        if self.verbose:
+            return {str(k): v for k, v in headers.items()}
+        return {k: headers.get(k) for k in self._HEADER_KEYS}
+
+    def _record_failure(self, url: str):
+        """接続レベルの失敗を記録する（連続失敗でブレーカーが開く）"""
+        count, last = self._fail.get(url, (0, 0.0))
+        now = time.time()
+        if now - last >= self._FAIL_WINDOW:
+            count = 0  # 古い失敗は数えない
+        self._fail[url] = (count + 1, now)
+
+    def _circuit_open(self, url: str) -> bool:
+        """対象URLのサーキットブレーカーが開いているか"""
+        count, last = self._fail.get(url, (0, 0.0))
+        return (count >= self._FAIL_THRESHOLD
+                and time.time() - last < self._FAIL_WINDOW)
+
+    def close(self):
+        """セッションとイベントループを閉じる"""
+        if self._session is not None and not self._session.closed:
+            self._loop.run_until_complete(self._session.close())
+        self._loop.close()
+
+    async def _aget(self, url: str, method: str = 'GET',
+                    json_body: dict = None) -> dict:
+        """単一URLへの非同期プローブ
+
+        Args:
+            url: プローブ先URL
+            method: HTTPメソッド（GET/POST）
+            json_body: POST時のJSONボディ
+
+        Returns:
+            ステータス・所要時間を含む結果dict
+        """
+        result = {
+            'url': url,
+            'success': False,
+            'status_code': None,
+            'response_time': None,
+        }
+
+        # 直近で連続失敗しているURLにはネットワークを使わず即応答する
+        if self._circuit_open(url):
+            result['error'] = (
+                f'サーキットブレーカー作動中'
+                f'（{self._FAIL_WINDOW}秒以内に{self._FAIL_THRESHOLD}回連続失敗）')
+            result['circuit_open'] = True
+            return result
+
+        try:
+            session = await self._ensure_session()
+            start = time.time()
+            async with session.request(method, url, json=json_body) as response:
+                result['response_time'] = round(time.time() - start, 3)
+                result['status_code'] = response.status
+                result['headers'] = self._capture_headers(response.headers)
+                # レスポンスが返ってきた時点で到達はできている
+                self._fail.pop(url, None)
+
+                content_type = response.headers.get('Content-Type', '')
+                if response.status == 200:
+                    result['success'] = True
+                    if 'application/json' in content_type:
+                        # JSONはパースして使うのでボディ全体が必要
+                        raw = await response.read()
+                        try:
+                            result['json_data'] = _json_loads(raw)
+                        except ValueError:
+                            result['text_data'] = (
+                                raw[:self._BODY_LIMIT].decode('utf-8',
+                                                              'replace'))
+                    else:
+                        # 先頭だけ読み、残りはダウンロードしない
+                        head = await response.content.read(self._BODY_LIMIT)
+                        result['text_data'] = head.decode('utf-8', 'replace')
+                else:
+                    head = await response.content.read(self._BODY_LIMIT)
+                    result['error_text'] = head.decode('utf-8', 'replace')
+
+        except asyncio.TimeoutError:
+            result['error'] = 'タイムアウト（接続3秒/読み取り10秒/全体30秒）'
+            self._record_failure(url)
+        except aiohttp.ClientConnectionError as e:
+            result['error'] = f'接続エラー: {e}'
+            self._record_failure(url)
+        except Exception as e:
+            result['error'] = f'予期しないエラー: {e}'
+
+        return result
+
+    @_ttl_cache(seconds=30)
+    async def _test_basic_endpoints(self) -> dict:
+        """基本エンドポイント疎通確認（非同期実装）
+
+        3つのエンドポイントは互いに独立なので、1つのgatherで
+        並行実行し、所要時間を最遅1件分に抑える。
+        """
+        self._status('🔍 基本エンドポイント疎通確認開始...')
+
+        tasks = [
+            self._aget(self._urls[name])
+            for name, _ in self._ENDPOINTS
+        ]
+        probe_results = await asyncio.gather(*tasks)
+
+        results = {
+            name: result
+            for (name, _), result in zip(self._ENDPOINTS, probe_results)
+        }
+        for name, result in results.items():
+            if result['success']:
+                self._status(f"  ✅ {name}: {result['status_code']} "
+                      f"({result['response_time']}秒)")
+            else:
+                self._status(f"  ❌ {name}: "
+                      f"{result.get('error', result['status_code'])}")
+
+        return results
+
+    def test_basic_endpoints(self) -> dict:
+        """基本エンドポイント疎通確認（同期ラッパー）"""
+        return self._run(self._test_basic_endpoints())
+
+    @_ttl_cache(seconds=30)
+    async def _simulate_research_flow(self) -> dict:
+        """調査開始フロー模擬実行（非同期実装）
+
+        フロントエンドと同じ順序でバリデーションAPIを叩き、
+        実際の調査は開始せずにリクエスト受付までを確認する。
+        """
+        self._status('🔍 調査フロー模擬実行開始...')
+
+        # 3ステップは独立に検証できるため並行実行する
+        prompts, validate, info = await asyncio.gather(
+            self._aget(self._urls['prompts']),
+            self._aget(self._urls['validate'],
+                       method='POST', json_body=_TEST_REQUEST_TEMPLATE),
+            self._aget(self._urls['info']),
+        )
+        results = {'prompts': prompts, 'validate': validate, 'info': info}
+
+        for name, result in results.items():
+            if result['success']:
+                self._status(f"  ✅ {name}: OK ({result['response_time']}秒)")
+            else:
+                self._status(f"  ❌ {name}: "
+                      f"{result.get('error', result['status_code'])}")
+
+        return results
+
+    def simulate_research_flow(self) -> dict:
+        """調査フロー模擬実行（同期ラッパー）"""
+        return self._run(self._simulate_research_flow())
+
+    @_ttl_cache(seconds=30)
+    async def _check_api_dependencies(self) -> dict:
+        """外部API依存の到達性確認（非同期実装）
+
+        本番環境が依存するNotion APIとGemini APIへの到達性を確認する。
+        認証なしでも「到達できるか」は判定できる（401/403も到達成功）。
+        """
+        self._status('🔍 外部API依存確認開始...')
+
+        tasks = [self._aget(url) for _, url in self._DEPENDENCIES]
+        probe_results = await asyncio.gather(*tasks)
+
+        results = {}
+        for (name, _), result in zip(self._DEPENDENCIES, probe_results):
+            # 認証エラー(401/403)でもAPI自体には到達できている
+            result['reachable'] = (result['status_code'] is not None
+                                   and result['status_code'] < 500)
+            results[name] = result
+            if result['reachable']:
+                self._status(f"  ✅ {name}: 到達可能 "
+                      f"({result['response_time']}秒)")
+            else:
+                self._status(f"  ❌ {name}: "
+                      f"{result.get('error', result['status_code'])}")
+
+        return results
+
+    def check_api_dependencies(self) -> dict:
+        """外部API依存確認（同期ラッパー）"""
+        return self._run(self._check_api_dependencies())
+
+    def analyze_error_patterns(self, log_text: str) -> dict:
+        """ログテキストから既知のエラーパターンを検出
+
+        Args:
+            log_text: 解析対象のログテキスト
+
+        Returns:
+            パターン名 -> 検出されたキーワードのリスト
+        """
+        self._status('🔍 エラーパターン解析開始...')
+
+        found = defaultdict(set)
+
+        if _AC_AUTOMATON is not None:
+            # 全キーワードを1回の線形走査で同時検出（Aho-Corasick）
+            for _, (pattern_name, kw) in _AC_AUTOMATON.iter(log_text.lower()):
+                found[pattern_name].add(kw)
+        else:
+            # フォールバック: エンコードと小文字化はここで1回だけ行い、
+            # 全グループの照合に使い回す（bytes.lowerはASCIIのみ対象
+            # だが、非ASCIIキーワードに大文字小文字の区別はないため
+            # 問題ない）
+            lowered = log_text.encode('utf-8', 'ignore').lower()
+
+            for pattern_name, group_res in _PATTERN_RES.items():
+                for probe, rx, group_kws in group_res:
+                    if probe not in lowered:
+                        continue
+                    # findallで全出現を列挙する必要はない。searchで
+                    # グループに当たりがあるか早期判定し、当たったとき
+                    # だけどのキーワードかをsubstring判定で確定する
+                    if rx.search(lowered) is None:
+                        continue
+                    found[pattern_name].update(
+                        kw.decode('utf-8')
+                        for kw in group_kws if kw in lowered)
+
+        findings = {}
+        for pattern_name in _PATTERNS:
+            matched = found.get(pattern_name)
+            if matched:
+                findings[pattern_name] = sorted(matched)
+                self._status(f"  ⚠️ {pattern_name}: {', '.join(sorted(matched))}")
+
+        if not findings:
+            self._status('  ✅ 既知のエラーパターンは検出されませんでした')
+
+        return findings
+
+    async def _gather_probes(self) -> tuple:
+        """3種のプローブを1つのgatherで完全並行実行"""
+        return await asyncio.gather(
+            self._test_basic_endpoints(),
+            self._simulate_research_flow(),
+            self._check_api_dependencies(),
+        )
+
+    def generate_debug_report(self) -> str:
+        """全プローブを実行してデバッグレポートを生成
+
+        Returns:
+            レポート文字列
+        """
+        self._status('📊 デバッグレポート生成開始...')
+        self._status('=' * 60)
+
+        basic, flow, deps = self._run(self._gather_probes())
+
+        # 中間リストを挟まず、バッファへ直接書き込んで組み立てる
+        buf = io.StringIO()
+        w = buf.write
+        divider = '=' * 60
+        now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        w(divider)
+        w('\n市場調査自動化システム デバッグレポート\n')
+        w(f'生成日時: {now_str}\n')
+        w(f'対象環境: {self.base_url}\n')
+        w(divider)
+        w('\n')
+
+        def write_section(title, results, ok_key, ok_label, ng_label):
+            w(f'\n【{title}】\n')
+            for name, result in results.items():
+                status = ok_label if result[ok_key] else ng_label
+                w(f"  {name}: {status} "
+                  f"(status={result['status_code']}, "
+                  f"time={result['response_time']}秒)\n")
+
+        write_section('基本エンドポイント', basic, 'success',
+                      '✅ OK', '❌ NG')
+        write_section('調査フロー', flow, 'success',
+                      '✅ OK', '❌ NG')
+        write_section('外部API依存', deps, 'reachable',
+                      '✅ 到達可能', '❌ 到達不可')
+
+        w('\n')
+        w(divider)
+
+        report = buf.getvalue()
+        print(report)
+        return report
+
+
+def interactive_main(tool: ProductionDebugTool):
+    """対話型メニュー（レガシーモード）"""
+    print('=' * 60)
+    print('🔧 市場調査自動化システム 本番環境デバッグツール')
+    print('=' * 60)
+
+    while True:
+        print('')
+        print('メニュー:')
+        print('  1: 基本エンドポイント疎通確認')
+        print('  2: 調査フロー模擬実行')
+        print('  3: 外部API依存確認')
+        print('  4: ログファイル解析')
+        print('  5: デバッグレポート生成')
+        print('  0: 終了')
+
+        choice = input('選択してください (0-5): ').strip()
+
+        if choice == '0':
+            print('👋 終了します')
+            break
+        elif choice == '1':
+            result = tool.test_basic_endpoints()
+            print(_json_dumps(result, pretty=True))
+        elif choice == '2':
+            result = tool.simulate_research_flow()
+            print(_json_dumps(result, pretty=True))
+        elif choice == '3':
+            result = tool.check_api_dependencies()
+            print(_json_dumps(result, pretty=True))
+        elif choice == '4':
+            log_path = input('ログファイルパス: ').strip()
+            try:
+                with open(log_path, encoding='utf-8', errors='ignore') as f:
+                    log_text = f.read()
+                result = tool.analyze_error_patterns(log_text)
+                print(_json_dumps(result, pretty=True))
+            except OSError as e:
+                print(f'❌ ログファイルを読み込めません: {e}')
+        elif choice == '5':
+            tool.generate_debug_report()
+        else:
+            print('⚠️ 0〜5で選択してください')
+
+        input('Enterキーで続行...')
+
+def main():
+    """コマンドライン エントリポイント
+
+    サブコマンド指定時はスクリプト用途とみなし、結果JSONを
+    コンパクト形式で標準出力へ書き出す（cron/CIからパイプ可能）。
+    サブコマンドなし、または--interactive指定時は従来の対話メニュー。
+    """
+    parser = argparse.ArgumentParser(
+        description='市場調査自動化システム 本番環境デバッグツール')
+    parser.add_argument('--base-url', default=PRODUCTION_URL,
+                        help='プローブ対象のベースURL（既定: 本番環境）')
+    parser.add_argument('--interactive', action='store_true',
+                        help='対話メニューを起動（レガシーモード）')
+    parser.add_argument('--verbose', action='store_true',
+                        help='結果に全レスポンスヘッダーを含める')
+    subparsers = parser.add_subparsers(dest='cmd')
+    subparsers.add_parser('basic', help='基本エンドポイント疎通確認')
+    subparsers.add_parser('flow', help='調査フロー模擬実行')
+    subparsers.add_parser('deps', help='外部API依存確認')
+    subparsers.add_parser('report', help='デバッグレポート生成')
+    logs_parser = subparsers.add_parser('logs', help='ログファイル解析')
+    logs_parser.add_argument('path', help='解析するログファイルのパス')
+
+    args = parser.parse_args()
+
+    # サブコマンド実行時は進行状況をstderrへ逃がし、stdoutには
+    # 結果（JSONまたはレポート本文）だけを流す
+    scripted = args.cmd is not None and not args.interactive
+    tool = ProductionDebugTool(
+        args.base_url,
+        verbose=args.verbose,
+        status_stream=sys.stderr if scripted else sys.stdout,
+    )
+    try:
+        if args.interactive or args.cmd is None:
+            interactive_main(tool)
+        elif args.cmd == 'report':
+            tool.generate_debug_report()
+        else:
+            if args.cmd == 'basic':
+                result = tool.test_basic_endpoints()
+            elif args.cmd == 'flow':
+                result = tool.simulate_research_flow()
+            elif args.cmd == 'deps':
+                result = tool.check_api_dependencies()
+            else:  # logs
+                with open(args.path, encoding='utf-8', errors='ignore') as f:
+                    result = tool.analyze_error_patterns(f.read())
+            # スクリプト用途なので整形なしのコンパクトJSONで出力する
+            sys.stdout.write(_json_dumps(result))
+            sys.stdout.write('\n')
+    finally:
+        tool.close()
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        print('\n👋 中断されました')
+        sys.exit(0)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# test_debug_production.py - デバッグツールのユニットテスト
+"""
+debug_production.pyのネットワーク非依存部分のテスト。
+
+orjson / pyahocorasickは任意依存なので、このテストは
+「インストールされていればそちらの実装、なければフォールバック」の
+どちらの構成でも同じ結果になることを確認する。
+
+実行:
+    python3 -m unittest test_debug_production
+"""
+
+import io
+import json
+import sys
+import types
+import unittest
+
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    # テスト対象はネットワークに出ない関数のみなので、
+    # aiohttp未導入の環境では型参照だけ満たすスタブで代替する
+    sys.modules['aiohttp'] = types.SimpleNamespace(
+        ClientSession=None,
+        TCPConnector=None,
+        ClientTimeout=None,
+        ClientConnectionError=ConnectionError,
+        ContentTypeError=ValueError,
+    )
+
+import debug_production as dp
+
+
+class _IStr(str):
+    """multidictのistr相当（strサブクラスのヘッダーキー）"""
+
+
+class JsonDumpsTest(unittest.TestCase):
+    """_json_dumps / _json_loads のテスト"""
+
+    def test_roundtrip_compact(self):
+        obj = {'name': 'テスト', 'count': 3, 'ok': True}
+        self.assertEqual(json.loads(dp._json_dumps(obj)), obj)
+
+    def test_roundtrip_pretty(self):
+        obj = {'name': 'テスト', 'nested': {'a': [1, 2]}}
+        dumped = dp._json_dumps(obj, pretty=True)
+        self.assertIn('\n', dumped)
+        self.assertEqual(json.loads(dumped), obj)
+
+    def test_non_ascii_not_escaped(self):
+        self.assertIn('テスト', dp._json_dumps({'x': 'テスト'}))
+
+    def test_str_subclass_keys(self):
+        # verboseモードのヘッダーはstrサブクラスのキーを持ち得る。
+        # orjsonの有無にかかわらずシリアライズできること
+        obj = {_IStr('Content-Type'): 'application/json'}
+        for pretty in (False, True):
+            self.assertEqual(
+                json.loads(dp._json_dumps(obj, pretty=pretty)),
+                {'Content-Type': 'application/json'})
+
+    def test_loads(self):
+        self.assertEqual(dp._json_loads(b'{"a": 1}'), {'a': 1})
+
+
+class CaptureHeadersTest(unittest.TestCase):
+    """_capture_headers のテスト"""
+
+    def _fake_headers(self):
+        return {
+            _IStr('Content-Type'): 'text/html',
+            _IStr('Content-Length'): '123',
+            _IStr('Server'): 'railway',
+            _IStr('X-Request-Id'): 'abc',
+        }
+
+    def _tool(self, verbose):
+        tool = dp.ProductionDebugTool.__new__(dp.ProductionDebugTool)
+        tool.verbose = verbose
+        return tool
+
+    def test_default_keeps_known_keys_only(self):
+        captured = self._tool(verbose=False)._capture_headers(
+            self._fake_headers())
+        self.assertEqual(sorted(captured),
+                         sorted(dp.ProductionDebugTool._HEADER_KEYS))
+        self.assertEqual(captured['Server'], 'railway')
+
+    def test_verbose_keeps_all_with_plain_str_keys(self):
+        captured = self._tool(verbose=True)._capture_headers(
+            self._fake_headers())
+        self.assertEqual(len(captured), 4)
+        for key in captured:
+            self.assertIs(type(key), str)
+
+    def test_verbose_result_serializes(self):
+        # --verbose basic 相当: verboseヘッダーを含む結果が
+        # どちらのJSON実装でもdumpできること（回帰テスト）
+        captured = self._tool(verbose=True)._capture_headers(
+            self._fake_headers())
+        result = {'headers': captured, 'status_code': 200}
+        for pretty in (False, True):
+            json.loads(dp._json_dumps(result, pretty=pretty))
+
+
+class AnalyzeErrorPatternsTest(unittest.TestCase):
+    """analyze_error_patterns のテスト（AC/正規表現どちらの経路でも同結果）"""
+
+    def setUp(self):
+        self.status = io.StringIO()
+        self.tool = dp.ProductionDebugTool.__new__(dp.ProductionDebugTool)
+        self.tool._status_stream = self.status
+
+    def test_detects_known_patterns(self):
+        findings = self.tool.analyze_error_patterns(
+            'ETIMEDOUT; Timed Out; タイムアウト発生; quota exceeded 429')
+        self.assertEqual(findings['timeout'],
+                         ['etimedout', 'timed out', 'タイムアウト'])
+        self.assertEqual(findings['rate_limit'], ['429', 'quota exceeded'])
+
+    def test_clean_log_has_no_findings(self):
+        self.assertEqual(self.tool.analyze_error_patterns('all clear'), {})
+
+    def test_status_lines_go_to_status_stream_not_stdout(self):
+        # スクリプトモードの前提: 進行状況はstatus_streamに流れ、
+        # stdout（結果JSON専用）には何も書かれないこと
+        captured = io.StringIO()
+        original = sys.stdout
+        sys.stdout = captured
+        try:
+            self.tool.analyze_error_patterns('ETIMEDOUT')
+        finally:
+            sys.stdout = original
+        self.assertEqual(captured.getvalue(), '')
+        self.assertIn('エラーパターン解析開始', self.status.getvalue())
+        self.assertIn('timeout', self.status.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()